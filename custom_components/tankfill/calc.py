@@ -1,6 +1,11 @@
 """Volume calculation for a horizontal cylindrical tank."""
 
-import math
+from collections.abc import Callable
+from math import asin, pi, sqrt
+
+# Segments shallower than this fraction of the diameter use a series
+# expansion rather than the closed-form segment area.
+SMALL_SEGMENT_RATIO = 1e-3
 
 
 def segment_volume(fill_depth: float, diameter: float, length: float) -> float:
@@ -18,21 +23,54 @@ def segment_volume(fill_depth: float, diameter: float, length: float) -> float:
     """
     if fill_depth <= 0:
         return 0.0
-    if fill_depth >= diameter:
-        radius = diameter / 2
-        return math.pi * radius**2 * length / 1000
 
     radius = diameter / 2
+    if fill_depth >= diameter:
+        return pi * radius**2 * length / 1000
+    if fill_depth == radius:
+        # Exactly half full - no need for the segment formula
+        return 0.5 * pi * radius**2 * length / 1000
+
+    r2 = radius * radius
+    if fill_depth > radius:
+        # More than half full - full circle minus the segment of empty space
+        # above, so the segment formula only ever sees the smaller segment
+        empty_area = _segment_area(diameter - fill_depth, diameter, radius, r2)
+        return (pi * r2 - empty_area) * length / 1000
+    return _segment_area(fill_depth, diameter, radius, r2) * length / 1000
+
+
+def _segment_area(
+    fill_depth: float, diameter: float, radius: float, r2: float
+) -> float:
+    """Calculate the area in cm² of a circular segment of the given depth.
+
+    Takes the radius and radius squared precomputed so callers can derive
+    them once per tank. fill_depth must be strictly between 0 and diameter.
+    """
+    if fill_depth < SMALL_SEGMENT_RATIO * diameter:
+        # The sector and triangle areas almost cancel for very shallow
+        # segments, so use the series for r²/2 * (theta - sin(theta)) with
+        # the central angle theta taken from a well-conditioned asin.
+        theta = 4 * asin(sqrt(fill_depth / diameter))
+        t2 = theta * theta
+        return (
+            r2 * theta * t2 / 12 * (1 - t2 / 20 * (1 - t2 / 42 * (1 - t2 / 72)))
+        )
+
+    # Half the central angle, from asin rather than acos(m / radius), which is
+    # badly conditioned for shallow segments where m / radius is close to 1
+    half_angle = 2 * asin(sqrt(fill_depth / diameter))
     m = radius - fill_depth
-    area_of_sector = math.acos(m / radius) * radius**2
-    area_of_triangle = m * math.sqrt(2 * radius * fill_depth - fill_depth**2)
-    return (area_of_sector - area_of_triangle) * length / 1000
+    area_of_sector = half_angle * r2
+    area_of_triangle = m * sqrt(fill_depth * (diameter - fill_depth))
+    return area_of_sector - area_of_triangle
 
 
 def max_volume(diameter: float, length: float) -> float:
     """Calculate maximum volume of a horizontal cylindrical tank in litres."""
     radius = diameter / 2
-    return math.pi * radius**2 * length / 1000
+    return pi * radius**2 * length / 1000
 
 
 def calculate_volume(
@@ -54,19 +92,66 @@ def calculate_volume(
     Returns:
         Volume in litres.
     """
+    radius = diameter / 2
+    return _volume_from_distance(
+        sensor_distance, diameter, radius, radius * radius, length / 1000
+    )
+
+
+def make_volume_fn(diameter: float, length: float) -> Callable[[float], float]:
+    """Build a calculate_volume equivalent specialised for one tank.
+
+    The radius, radius squared and length/1000 scale are derived once here
+    rather than on every call, for callers that convert many readings for
+    the same tank.
+
+    Args:
+        diameter: Tank diameter in cm.
+        length: Tank length in cm.
+
+    Returns:
+        A function taking the sensor distance in cm and returning the
+        volume in litres.
+    """
+    radius = diameter / 2
+    r2 = radius * radius
+    length_over_1000 = length / 1000
+
+    def volume(sensor_distance: float) -> float:
+        return _volume_from_distance(
+            sensor_distance, diameter, radius, r2, length_over_1000
+        )
+
+    return volume
+
+
+def _volume_from_distance(
+    sensor_distance: float,
+    diameter: float,
+    radius: float,
+    r2: float,
+    length_over_1000: float,
+) -> float:
+    """Calculate volume from the sensor distance using precomputed geometry.
+
+    Shared by calculate_volume and the functions built by make_volume_fn.
+    """
     if sensor_distance >= diameter:
         return 0.0
     if sensor_distance <= 0:
-        return max_volume(diameter, length)
+        return pi * r2 * length_over_1000
 
     liquid_depth = diameter - sensor_distance
 
-    if liquid_depth <= diameter / 2:
-        # Less than or equal to half full - use segment formula with liquid depth
-        return segment_volume(liquid_depth, diameter, length)
+    if liquid_depth == radius:
+        # Exactly half full - no need for the segment formula
+        return 0.5 * pi * r2 * length_over_1000
+    if liquid_depth < radius:
+        # Less than half full - segment area of the liquid depth
+        area = _segment_area(liquid_depth, diameter, radius, r2)
+        return area * length_over_1000
 
-    # More than half full - total volume minus the empty space above the liquid.
+    # More than half full - full circle minus the segment of empty space.
     # sensor_distance is the height of the empty space from the top.
-    return max_volume(diameter, length) - segment_volume(
-        sensor_distance, diameter, length
-    )
+    empty_area = _segment_area(sensor_distance, diameter, radius, r2)
+    return (pi * r2 - empty_area) * length_over_1000
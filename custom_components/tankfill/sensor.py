@@ -21,7 +21,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
-from .calc import calculate_volume, max_volume
+from .calc import make_volume_fn, max_volume
 from .const import (
     CONF_DEPTH_SENSOR,
     CONF_PRICE_PER_LITRE,
@@ -98,6 +98,31 @@ async def async_setup_entry(
         update_before_add=False,
     )
 
+    # Tank geometry is fixed for the lifetime of the entry, so derive it once
+    # here rather than on every depth update.
+    volume_fn = make_volume_fn(diameter, length)
+    max_vol = max_volume(diameter, length)
+
+    last_depth: float | None = None
+    last_volume = 0.0
+
+    @callback
+    def _async_process_depth(depth: float) -> None:
+        """Push a new sensor distance reading to all sensors."""
+        nonlocal last_depth, last_volume
+
+        # The depth sensor can report the same reading repeatedly; the depth,
+        # volume and percentage sensors would not change, so skip them. The
+        # tracker still needs the reading to keep its rolling windows current.
+        if depth != last_depth:
+            last_depth = depth
+            last_volume = volume_fn(depth)
+            oil_depth_sensor.update_depth(diameter - depth)
+            volume_sensor.update_volume(last_volume)
+            percentage_sensor.update_percentage(last_volume, max_vol)
+
+        tracker.update_usage(last_volume)
+
     @callback
     def _async_sensor_changed(event: Event[EventStateChangedData]) -> None:
         """Handle depth sensor state changes."""
@@ -110,14 +135,7 @@ async def async_setup_entry(
         except (ValueError, TypeError):
             return
 
-        liquid_depth = diameter - depth
-        volume = calculate_volume(depth, diameter, length)
-        max_vol = max_volume(diameter, length)
-
-        oil_depth_sensor.update_depth(liquid_depth)
-        volume_sensor.update_volume(volume)
-        percentage_sensor.update_percentage(volume, max_vol)
-        tracker.update_usage(volume)
+        _async_process_depth(depth)
 
     # Listen for changes on the external depth sensor
     entry.async_on_unload(
@@ -135,13 +153,7 @@ async def async_setup_entry(
         except (ValueError, TypeError):
             pass
         else:
-            liquid_depth = diameter - depth
-            volume = calculate_volume(depth, diameter, length)
-            max_vol = max_volume(diameter, length)
-            oil_depth_sensor.update_depth(liquid_depth)
-            volume_sensor.update_volume(volume)
-            percentage_sensor.update_percentage(volume, max_vol)
-            tracker.update_usage(volume)
+            _async_process_depth(depth)
 
 
 class TankFillBaseSensor(SensorEntity):
@@ -159,6 +171,14 @@ class TankFillBaseSensor(SensorEntity):
             manufacturer="Tank Fill",
         )
 
+    @callback
+    def _async_set_native_value(self, value: float) -> None:
+        """Set the native value, writing state only if it changed."""
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
 
 class TankOilDepthSensor(TankFillBaseSensor):
     """Sensor for oil depth in cm."""
@@ -177,8 +197,7 @@ class TankOilDepthSensor(TankFillBaseSensor):
     @callback
     def update_depth(self, depth: float) -> None:
         """Update the oil depth value."""
-        self._attr_native_value = round(max(depth, 0.0), 1)
-        self.async_write_ha_state()
+        self._async_set_native_value(round(depth, 1) if depth > 0 else 0.0)
 
 
 class TankVolumeSensor(TankFillBaseSensor):
@@ -202,8 +221,7 @@ class TankVolumeSensor(TankFillBaseSensor):
     @callback
     def update_volume(self, volume: float) -> None:
         """Update the volume value."""
-        self._attr_native_value = round(volume, 1)
-        self.async_write_ha_state()
+        self._async_set_native_value(round(volume, 1))
 
 
 class TankFillPercentageSensor(TankFillBaseSensor):
@@ -227,10 +245,9 @@ class TankFillPercentageSensor(TankFillBaseSensor):
     def update_percentage(self, volume: float, max_vol: float) -> None:
         """Update the fill percentage."""
         if max_vol > 0:
-            self._attr_native_value = round(volume / max_vol * 100, 1)
+            self._async_set_native_value(round(volume / max_vol * 100, 1))
         else:
-            self._attr_native_value = 0
-        self.async_write_ha_state()
+            self._async_set_native_value(0)
 
 
 class TankLastRefillSensor(TankFillBaseSensor):
@@ -393,8 +410,7 @@ class TankUsageTrackerSensor(TankFillBaseSensor, RestoreSensor):
         avg_daily = weekly / 7
 
         # Own value: avg daily usage
-        self._attr_native_value = round(avg_daily, 1)
-        self.async_write_ha_state()
+        self._async_set_native_value(round(avg_daily, 1))
 
         # Push to usage sensors
         self._usage_sensors["weekly"].set_value(weekly)
@@ -427,8 +443,7 @@ class TankPeriodUsageSensor(TankFillBaseSensor):
     @callback
     def set_value(self, usage: float) -> None:
         """Update the usage value."""
-        self._attr_native_value = round(usage, 1)
-        self.async_write_ha_state()
+        self._async_set_native_value(round(usage, 1))
 
 
 class TankPeriodCostSensor(TankFillBaseSensor):
@@ -459,5 +474,4 @@ class TankPeriodCostSensor(TankFillBaseSensor):
     @callback
     def set_value(self, usage: float) -> None:
         """Update the cost value based on usage."""
-        self._attr_native_value = round(usage * self._price_per_litre, 2)
-        self.async_write_ha_state()
+        self._async_set_native_value(round(usage * self._price_per_litre, 2))
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
 
 REFILL_THRESHOLD = 100  # litres – volume increase above this = refill
 
 
+def _utc_iso(timestamp: datetime) -> str:
+    """Format a timestamp as an ISO string in UTC.
+
+    Local-offset strings stop sorting chronologically when the clocks go
+    back (01:59+01:00 is followed by 01:00+00:00); UTC strings always do.
+    """
+    return timestamp.astimezone(timezone.utc).isoformat()
+
+
 class UsageHistory:
     """Tracks volume readings and calculates consumption over rolling windows.
 
     Consumption is the sum of volume decreases between consecutive readings.
     Volume increases (refills) are ignored.
+
+    A running total of consumption is kept alongside the readings, so usage
+    over any window is the difference between two totals rather than a walk
+    over every reading in it.
+
+    Readings are kept oldest-first with UTC ISO timestamps, so string order
+    matches chronological order; pruning and window lookups bisect on it.
     """
 
     MAX_AGE_DAYS = 400  # buffer beyond 365
@@ -21,10 +39,20 @@ class UsageHistory:
         """Initialise with optional existing readings.
 
         Args:
-            readings: list of (iso_timestamp_str, volume_float) tuples,
+            readings: list of (utc_iso_timestamp_str, volume_float) tuples,
                       ordered oldest-first.
         """
         self._readings: list[tuple[str, float]] = readings or []
+        # _consumed[i] is the total consumption from the first reading up to
+        # and including reading i.
+        self._consumed: list[float] = []
+        total = 0.0
+        prev_vol: float | None = None
+        for _, vol in self._readings:
+            if prev_vol is not None and vol < prev_vol:
+                total += prev_vol - vol
+            self._consumed.append(total)
+            prev_vol = vol
 
     def add_reading(self, timestamp: datetime, volume: float) -> dict | None:
         """Append a reading and prune entries older than MAX_AGE_DAYS.
@@ -34,11 +62,30 @@ class UsageHistory:
         """
         prev_vol: float | None = self._readings[-1][1] if self._readings else None
 
-        self._readings.append((timestamp.isoformat(), volume))
-        cutoff = (timestamp - timedelta(days=self.MAX_AGE_DAYS)).isoformat()
-        self._readings = [
-            (ts, vol) for ts, vol in self._readings if ts >= cutoff
-        ]
+        if (
+            volume == prev_vol
+            and len(self._readings) >= 2
+            and self._readings[-2][1] == volume
+        ):
+            # Within a run of identical readings only the first (where any
+            # consumption landed) and the latest (the anchor for windows
+            # starting after it) matter, so move the latest forward instead
+            # of growing the history.
+            self._readings[-1] = (_utc_iso(timestamp), volume)
+        else:
+            total = self._consumed[-1] if self._consumed else 0.0
+            if prev_vol is not None and volume < prev_vol:
+                total += prev_vol - volume
+
+            self._readings.append((_utc_iso(timestamp), volume))
+            self._consumed.append(total)
+
+        # Readings are ordered oldest-first, so expired ones are a prefix
+        cutoff = _utc_iso(timestamp - timedelta(days=self.MAX_AGE_DAYS))
+        expired = bisect_left(self._readings, cutoff, key=itemgetter(0))
+        if expired:
+            del self._readings[:expired]
+            del self._consumed[:expired]
 
         if prev_vol is not None:
             delta = volume - prev_vol
@@ -58,35 +105,17 @@ class UsageHistory:
         Includes the last reading before the window to capture consumption
         that straddles the boundary.
         """
-        since_iso = since.isoformat()
-
-        # Find readings in window, plus the last one before it
-        before_window: tuple[str, float] | None = None
-        in_window: list[tuple[str, float]] = []
-
-        for ts, vol in self._readings:
-            if ts < since_iso:
-                before_window = (ts, vol)
-            else:
-                in_window.append((ts, vol))
-
-        # Build the sequence to walk: [last-before-window] + [in-window]
-        sequence: list[tuple[str, float]] = []
-        if before_window is not None:
-            sequence.append(before_window)
-        sequence.extend(in_window)
-
-        if len(sequence) < 2:
+        if not self._readings:
             return 0.0
 
-        usage = 0.0
-        for i in range(1, len(sequence)):
-            prev_vol = sequence[i - 1][1]
-            curr_vol = sequence[i][1]
-            if curr_vol < prev_vol:
-                usage += prev_vol - curr_vol
+        # Index of the first reading in the window; the one before it (if
+        # any) anchors consumption that straddles the boundary.
+        first_in_window = bisect_left(
+            self._readings, _utc_iso(since), key=itemgetter(0)
+        )
+        start = max(first_in_window - 1, 0)
 
-        return usage
+        return self._consumed[-1] - self._consumed[start]
 
     def as_list(self) -> list[dict[str, str | float]]:
         """Serialise readings for persistence."""
@@ -94,6 +123,12 @@ class UsageHistory:
 
     @classmethod
     def from_list(cls, data: list[dict[str, str | float]]) -> UsageHistory:
-        """Restore from serialised data."""
-        readings = [(d["t"], float(d["v"])) for d in data]
+        """Restore from serialised data.
+
+        Timestamps are normalised to UTC, as data saved by earlier versions
+        may carry local UTC offsets.
+        """
+        readings = [
+            (_utc_iso(datetime.fromisoformat(d["t"])), float(d["v"])) for d in data
+        ]
         return cls(readings)
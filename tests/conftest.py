@@ -28,7 +28,9 @@ for mod_name in _HA_MODULES:
 # Set up realistic stand-ins for the HA classes our code inherits from or uses
 
 _sensor_mod = sys.modules["homeassistant.components.sensor"]
-_sensor_mod.SensorEntity = type("SensorEntity", (), {"_attr_should_poll": False})
+_sensor_mod.SensorEntity = type(
+    "SensorEntity", (), {"_attr_should_poll": False, "_attr_native_value": None}
+)
 _sensor_mod.RestoreSensor = type("RestoreSensor", (_sensor_mod.SensorEntity,), {})
 _sensor_mod.SensorDeviceClass = MagicMock()
 _sensor_mod.SensorStateClass = MagicMock()
@@ -1,6 +1,7 @@
 """Tests for UsageHistory rolling-window consumption tracking."""
 
 from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -38,6 +39,31 @@ class TestAddReading:
         h.add_reading(_dt(), 480.0)
         assert len(h.as_list()) == 2  # 450-day-old reading pruned
 
+    def test_repeated_readings_collapsed(self):
+        h = UsageHistory()
+        h.add_reading(_dt(days_ago=3), 500.0)
+        h.add_reading(_dt(days_ago=2), 490.0)
+        h.add_reading(_dt(days_ago=1), 490.0)
+        h.add_reading(_dt(), 490.0)
+        data = h.as_list()
+        # Only the first and latest of the 490 run are kept
+        assert [d["v"] for d in data] == [500.0, 490.0, 490.0]
+        assert data[-1]["t"] == _dt().isoformat()
+        assert h.usage_since(_dt(days_ago=7)) == pytest.approx(10.0)
+        assert h.usage_since(_dt(hours_ago=12)) == 0.0
+
+    def test_repeated_readings_still_prune(self):
+        h = UsageHistory()
+        h.add_reading(_dt(days_ago=399), 500.0)
+        h.add_reading(_dt(days_ago=10), 490.0)
+        h.add_reading(_dt(days_ago=5), 490.0)
+        # Collapses into the previous reading, and takes the first reading
+        # past MAX_AGE_DAYS
+        h.add_reading(_dt(days_ago=-2), 490.0)
+        data = h.as_list()
+        assert [d["v"] for d in data] == [490.0, 490.0]
+        assert data[-1]["t"] == _dt(days_ago=-2).isoformat()
+
     def test_returns_none_for_normal_reading(self):
         h = UsageHistory()
         assert h.add_reading(_dt(days_ago=1), 500.0) is None
@@ -166,6 +192,28 @@ class TestUsageSince:
         h.add_reading(_dt(), 985.0)              # -15
         assert h.usage_since(_dt(days_ago=7)) == pytest.approx(55.0)
 
+    def test_window_across_dst_fall_back(self):
+        """Readings either side of the clocks going back stay in time order."""
+        london = ZoneInfo("Europe/London")
+        h = UsageHistory()
+        # 26 Oct 2025: 01:00-02:00 BST is followed by 01:00-02:00 GMT
+        h.add_reading(datetime(2025, 10, 26, 0, 30, tzinfo=london), 500.0)
+        h.add_reading(datetime(2025, 10, 26, 1, 50, tzinfo=london), 490.0)
+        h.add_reading(datetime(2025, 10, 26, 1, 10, fold=1, tzinfo=london), 480.0)
+        h.add_reading(datetime(2025, 10, 26, 1, 40, fold=1, tzinfo=london), 470.0)
+        # Window starts at 01:05 GMT: 01:50 BST (00:50 GMT) is the anchor
+        since = datetime(2025, 10, 26, 1, 5, fold=1, tzinfo=london)
+        assert h.usage_since(since) == pytest.approx(20.0)
+
+    def test_pruned_consumption_not_counted(self):
+        """Consumption before pruned readings should not leak into windows."""
+        h = UsageHistory()
+        h.add_reading(_dt(days_ago=450), 1000.0)  # pruned
+        h.add_reading(_dt(days_ago=420), 900.0)   # pruned
+        h.add_reading(_dt(days_ago=5), 880.0)
+        h.add_reading(_dt(), 870.0)
+        assert h.usage_since(_dt(days_ago=365)) == pytest.approx(10.0)
+
 
 class TestSerialization:
     """Test as_list / from_list round-trip."""
@@ -187,6 +235,22 @@ class TestSerialization:
         restored = UsageHistory.from_list(data)
         assert restored.usage_since(_dt(days_ago=7)) == 0.0
 
+    def test_from_list_normalises_local_offsets(self):
+        """Data saved with local UTC offsets is restored in time order."""
+        data = [
+            {"t": "2025-10-26T00:30:00+01:00", "v": 500.0},
+            {"t": "2025-10-26T01:50:00+01:00", "v": 490.0},
+            {"t": "2025-10-26T01:10:00+00:00", "v": 480.0},
+        ]
+        restored = UsageHistory.from_list(data)
+        assert [d["t"] for d in restored.as_list()] == [
+            "2025-10-25T23:30:00+00:00",
+            "2025-10-26T00:50:00+00:00",
+            "2025-10-26T01:10:00+00:00",
+        ]
+        since = datetime(2025, 10, 26, 1, 0, tzinfo=timezone.utc)
+        assert restored.usage_since(since) == pytest.approx(10.0)
+
     def test_serialized_format(self):
         h = UsageHistory()
         h.add_reading(_dt(), 500.0)
@@ -201,6 +201,14 @@ class TestPeriodUsageSensor:
         sensor.set_value(42.7)
         assert sensor._attr_native_value == 42.7
 
+    def test_unchanged_value_not_written(self):
+        sensor = TankPeriodUsageSensor(FakeConfigEntry(), "weekly_usage", "oil_weekly_usage")
+        sensor.async_write_ha_state = MagicMock()
+        sensor.set_value(42.7)
+        sensor.set_value(42.7)
+        sensor.set_value(42.71)  # rounds to the same value
+        assert sensor.async_write_ha_state.call_count == 1
+
     def test_unique_id(self):
         sensor = TankPeriodUsageSensor(FakeConfigEntry(), "monthly_usage", "oil_monthly_usage")
         assert sensor._attr_unique_id == "test_entry_monthly_usage"
@@ -221,6 +229,16 @@ class TestPeriodCostSensor:
         sensor.set_value(3.333)
         assert sensor._attr_native_value == 1.83
 
+    def test_price_change_rewrites_unchanged_usage(self):
+        sensor = TankPeriodCostSensor(FakeConfigEntry(), "weekly_cost", "oil_weekly_cost", 0.55)
+        sensor.async_write_ha_state = MagicMock()
+        sensor.set_value(10.0)
+        sensor.set_value(10.0)
+        sensor.update_price(0.60)
+        sensor.set_value(10.0)
+        assert sensor._attr_native_value == 6.00
+        assert sensor.async_write_ha_state.call_count == 2
+
     def test_unique_id(self):
         sensor = TankPeriodCostSensor(FakeConfigEntry(), "yearly_cost", "oil_yearly_cost", 0.55)
         assert sensor._attr_unique_id == "test_entry_yearly_cost"
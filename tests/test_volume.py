@@ -5,7 +5,9 @@ import math
 import pytest
 
 from custom_components.tankfill.calc import (
+    SMALL_SEGMENT_RATIO,
     calculate_volume,
+    make_volume_fn,
     max_volume,
     segment_volume,
 )
@@ -66,33 +68,59 @@ class TestSegmentVolume:
         vol_high = segment_volume(80, DIAMETER, LENGTH)
         assert vol_low + vol_high == pytest.approx(MAX_VOL)
 
+    def test_nearly_full_precision(self):
+        # Just below full, the chord term must not lose precision to
+        # cancellation - the result should be within rounding of max volume
+        vol = segment_volume(DIAMETER - 1e-10, DIAMETER, LENGTH)
+        assert vol == pytest.approx(MAX_VOL, abs=2e-8)
+
     def test_very_small_depth(self):
         vol = segment_volume(1, DIAMETER, LENGTH)
         assert 0 < vol < MAX_VOL * 0.01
 
+    def test_tiny_depth_precision(self):
+        # For very shallow segments the area tends to 4/3 * sqrt(D) * d^1.5;
+        # the closed form loses most of its digits to cancellation here
+        depth = 1e-6
+        expected = 4 / 3 * math.sqrt(DIAMETER) * depth**1.5 * LENGTH / 1000
+        assert segment_volume(depth, DIAMETER, LENGTH) == pytest.approx(
+            expected, rel=1e-8, abs=0
+        )
 
-class TestCalculateVolume:
-    """Tests for calculate_volume() - sensor distance from the top."""
-
-    def test_tank_full_sensor_at_zero(self):
-        # Sensor distance 0 = liquid at the very top = full
-        assert calculate_volume(0, DIAMETER, LENGTH) == pytest.approx(MAX_VOL)
-
-    def test_tank_full_sensor_negative(self):
-        # Negative sensor distance = still full (clamped)
-        assert calculate_volume(-5, DIAMETER, LENGTH) == pytest.approx(MAX_VOL)
+    @pytest.mark.parametrize(
+        ("depth", "expected"),
+        [
+            # Reference volumes from 50-digit mpmath evaluation
+            pytest.param(0.0999, 0.08417570526614698678, id="below_threshold"),
+            pytest.param(0.10001, 0.084314744630829574606, id="above_threshold"),
+            pytest.param(0.15, 0.1548496014638512429, id="well_above_threshold"),
+        ],
+    )
+    def test_precision_around_small_segment_threshold(self, depth, expected):
+        # Both sides of SMALL_SEGMENT_RATIO * DIAMETER (0.1cm) should keep
+        # close to full double precision
+        assert SMALL_SEGMENT_RATIO * DIAMETER == 0.1
+        assert segment_volume(depth, DIAMETER, LENGTH) == pytest.approx(
+            expected, rel=1e-12, abs=0
+        )
 
-    def test_tank_empty_sensor_at_diameter(self):
-        # Sensor distance = diameter = no liquid
-        assert calculate_volume(DIAMETER, DIAMETER, LENGTH) == 0.0
 
-    def test_tank_empty_sensor_beyond_diameter(self):
-        # Sensor distance > diameter = still empty
-        assert calculate_volume(DIAMETER + 10, DIAMETER, LENGTH) == 0.0
+class TestCalculateVolume:
+    """Tests for calculate_volume() - sensor distance from the top."""
 
-    def test_half_full(self):
-        # Sensor distance = 50 = half the diameter = half full
-        assert calculate_volume(50, DIAMETER, LENGTH) == pytest.approx(MAX_VOL / 2)
+    @pytest.mark.parametrize(
+        ("sensor_distance", "expected_fraction"),
+        [
+            pytest.param(0, 1.0, id="full_sensor_at_zero"),
+            pytest.param(-5, 1.0, id="full_sensor_negative"),  # clamped
+            pytest.param(50, 0.5, id="half_full"),
+            pytest.param(DIAMETER, 0.0, id="empty_sensor_at_diameter"),
+            pytest.param(DIAMETER + 10, 0.0, id="empty_sensor_beyond_diameter"),
+        ],
+    )
+    def test_fixed_points(self, sensor_distance, expected_fraction):
+        vol = calculate_volume(sensor_distance, DIAMETER, LENGTH)
+        assert vol == pytest.approx(MAX_VOL * expected_fraction)
 
     def test_mostly_full(self):
         # Sensor distance 10 = liquid depth 90 = more than half full
@@ -118,6 +146,16 @@ class TestCalculateVolume:
             assert vol < prev_vol, f"Volume not decreasing at distance {dist}"
             prev_vol = vol
 
+    def test_over_half_matches_empty_space_complement(self):
+        # Above half full, volume should be the full tank minus the segment
+        # of empty space above the liquid
+        for tenths in range(1, DIAMETER * 5):
+            dist = tenths / 10
+            vol = calculate_volume(dist, DIAMETER, LENGTH)
+            expected = MAX_VOL - segment_volume(dist, DIAMETER, LENGTH)
+            diff = abs(vol - expected)
+            assert diff < 1e-9, f"Mismatch at sensor_distance={dist}: {diff}"
+
     def test_inverse_relationship(self):
         # Volume at sensor_distance d should equal segment_volume at
         # liquid_depth (diameter - d) for all values
@@ -125,6 +163,31 @@ class TestCalculateVolume:
             vol = calculate_volume(dist, DIAMETER, LENGTH)
             liquid_depth = DIAMETER - dist
             expected = segment_volume(liquid_depth, DIAMETER, LENGTH)
-            assert vol == pytest.approx(expected, abs=0.001), (
-                f"Mismatch at sensor_distance={dist}"
+            diff = abs(vol - expected)
+            assert diff < 1e-3, f"Mismatch at sensor_distance={dist}: {diff}"
+
+
+class TestMakeVolumeFn:
+    """Tests for make_volume_fn() - per-tank specialised calculate_volume."""
+
+    def test_matches_reference_formula(self):
+        # Compare against the circular segment formula written out in full,
+        # independent of the helpers in calc.py
+        volume = make_volume_fn(DIAMETER, LENGTH)
+        radius = DIAMETER / 2
+        for tenths in range(-50, DIAMETER * 10 + 50):
+            dist = tenths / 10
+            liquid_depth = min(max(DIAMETER - dist, 0), DIAMETER)
+            m = radius - liquid_depth
+            area = math.acos(m / radius) * radius**2 - m * math.sqrt(
+                2 * radius * liquid_depth - liquid_depth**2
             )
+            expected = area * LENGTH / 1000
+            diff = abs(volume(dist) - expected)
+            assert diff < 1e-9, f"Mismatch at sensor_distance={dist}: {diff}"
+
+    def test_geometry_is_per_tank(self):
+        small = make_volume_fn(50, 100)
+        large = make_volume_fn(DIAMETER, LENGTH)
+        assert small(0) == pytest.approx(max_volume(50, 100))
+        assert large(0) == pytest.approx(MAX_VOL)